@@ -12,48 +12,92 @@ Features:
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-import speech_recognition as sr
-import pyttsx3
-import requests
 import threading
+import queue
 import time
 import json
 import os
 import re
-from datetime import datetime, timedelta
+import logging
+from collections import defaultdict
+from datetime import datetime
+
+try:
+    import orjson  # Optional: much faster config serialization
+except ImportError:
+    orjson = None
+
+log = logging.getLogger("gaming_assistant")
 
 # Global configuration
 CONFIG_FILE = "config.json"
+CONFIG_SAVE_DELAY_MS = 2000  # Coalesce bursts of reminder changes into one write
+TIMER_REFRESH_MS = 30000     # Countdown refresh while a time reminder is pending
 DEFAULT_CONFIG = {
     "steam_api_key": "",
     "steam_id": "",
     "reminders": []
 }
 
+# Voice capture limits (seconds)
+LISTEN_TIMEOUT = 5       # Wait this long for speech to start
+PHRASE_TIME_LIMIT = 10   # Longest single command
+
+STEAM_API_URL = "https://api.steampowered.com/ISteamUser/GetPlayerSummaries/v0002/?key={key}&steamids={steam_id}"
+
+# Voice command patterns (compiled once, reused for every command)
+_TIME_RE = re.compile(r'(?:in|after) (\d+) minutes?', re.IGNORECASE)
+_STRIP_LEAD_RE = re.compile(r'.*?(?:remind me|set reminder) (?:to )?', re.IGNORECASE)
+_STRIP_TAIL_RE = re.compile(r'(?:in|after) \d+ minutes?.*', re.IGNORECASE)
+_STRIP_EVENT_RE = re.compile(r'.*remind me (to )?', re.IGNORECASE)
+_CLEAR_RE = re.compile(r'.*clear reminder (about )?', re.IGNORECASE)
+_WORD_RE = re.compile(r'[a-z]+')
+
+# Whole-word keywords that mark a reminder as resource-based
+_RESOURCE_WORDS = frozenset({
+    "gold", "wood", "food", "iron", "stone", "resource",
+    "woods", "foods", "irons", "stones", "resources",
+})
+
 class Reminder:
     """Data structure for game reminders"""
-    def __init__(self, text, reminder_type="event", trigger_time=None):
+    __slots__ = ("text", "reminder_type", "trigger_epoch", "created_epoch")
+
+    def __init__(self, text, reminder_type="event", trigger_epoch=None):
         self.text = text
         self.reminder_type = reminder_type  # time, resource, event
-        self.trigger_time = trigger_time
-        self.created_at = datetime.now()
+        self.trigger_epoch = trigger_epoch  # time.monotonic() deadline (time reminders)
+        self.created_epoch = time.time()
 
     def to_dict(self):
         """Serialize for JSON storage"""
+        trigger_epoch = None
+        if self.trigger_epoch is not None:
+            # Monotonic time is per-process; persist the equivalent Unix time
+            trigger_epoch = self.trigger_epoch - time.monotonic() + time.time()
         return {
             "text": self.text,
             "type": self.reminder_type,
-            "trigger_time": self.trigger_time.isoformat() if self.trigger_time else None,
-            "created_at": self.created_at.isoformat()
+            "trigger_epoch": trigger_epoch,
+            "created_epoch": self.created_epoch
         }
 
     @staticmethod
     def from_dict(data):
         """Deserialize from JSON"""
         reminder = Reminder(data["text"], data["type"])
-        if data.get("trigger_time"):
-            reminder.trigger_time = datetime.fromisoformat(data["trigger_time"])
-        reminder.created_at = datetime.fromisoformat(data["created_at"])
+        if "created_epoch" in data:
+            trigger_epoch = data.get("trigger_epoch")
+            reminder.created_epoch = data["created_epoch"]
+        else:
+            # Legacy config with ISO timestamps
+            trigger_epoch = None
+            if data.get("trigger_time"):
+                trigger_epoch = datetime.fromisoformat(data["trigger_time"]).timestamp()
+            reminder.created_epoch = datetime.fromisoformat(data["created_at"]).timestamp()
+
+        if trigger_epoch is not None:
+            reminder.trigger_epoch = time.monotonic() + (trigger_epoch - time.time())
         return reminder
 
 class GamingAssistant:
@@ -64,32 +108,47 @@ class GamingAssistant:
         self.root.title("Gaming Assistant - Voice Command Center")
         self.root.geometry("700x600")
 
-        # Print Python version for debugging
+        # Log Python version for debugging
         import sys
-        print(f"Running with Python {sys.version}")
+        log.debug("Running with Python %s", sys.version)
 
         # Initialize components
         self.config = self.load_config()
         self.reminders = []
+
+        # Keyword index for clear_specific_reminder: token -> ids of reminders containing it
+        self._token_index = defaultdict(set)
+        self._by_id = {}
         self.listening = False
         self.game_mode_active = False
         self.current_game = "No game running"
 
-        # Voice components
-        try:
-            self.recognizer = sr.Recognizer()
-            print("✓ Speech recognition initialized")
-            self.tts_engine = pyttsx3.init()
-            print("✓ Text-to-speech initialized")
-            # Adjust TTS speed for clarity (ADHD: slower = easier to process)
-            self.tts_engine.setProperty('rate', 150)
-        except Exception as e:
-            print(f"Audio setup error: {str(e)}")
-            import traceback
-            traceback.print_exc()
+        # In-memory config cache: only touch disk when reminders actually change
+        self._config_dirty = False
+        self._pending_flush = None  # Tk after() handle for the debounced write
+        self._rendered_reminders = None  # Last text shown in the reminder list
+        self._timer_handle = None  # Tk after() handle for the next check_timers wake-up
+
+        # Voice input: set up off the Tk thread so the window appears immediately
+        self.recognizer = None
+        self.microphone = None
+        self._mic_setup_done = False
+        self._armed = False           # Next phrase is a command (set by the mic button)
+        self._armed_at = 0.0          # time.monotonic() of the arming button press
+        self._stop_listening = None   # Stopper for the background listener
+        self._listen_timeout = None   # Tk after() handle for the no-speech timeout
+        threading.Thread(target=self.init_voice_input, daemon=True).start()
+
+        # Single TTS worker: speech never blocks the Tk thread.
+        # pyttsx3 is loaded by the worker on the first utterance.
+        self.tts_engine = None
+        self._tts_q = queue.Queue()
+        threading.Thread(target=self._tts_worker, daemon=True).start()
 
         # Steam polling thread control
         self.steam_poll_active = False
+        self._steam_session = None  # Keep-alive HTTP session, created on first poll start
+        self.update_steam_url()
 
         # Build GUI
         self.build_gui()
@@ -101,8 +160,30 @@ class GamingAssistant:
         if self.config["steam_api_key"] and self.config["steam_id"]:
             self.start_steam_polling()
 
-        # Start timer check loop
-        self.check_timers()
+        # Schedule the first due time reminder (no fixed polling loop)
+        self._schedule_next()
+
+    def init_voice_input(self):
+        """Load speech recognition and keep the microphone hot for the whole session"""
+        try:
+            import speech_recognition as sr
+            self.recognizer = sr.Recognizer()
+            log.info("✓ Speech recognition initialized")
+
+            # Open the microphone once; calibrate for ambient noise once, not on every command
+            self.microphone = sr.Microphone()
+            with self.microphone as source:
+                self.recognizer.adjust_for_ambient_noise(source, duration=1.0)
+            # Keep adapting to room noise from here on
+            self.recognizer.dynamic_energy_threshold = True
+            log.info("✓ Microphone calibrated")
+            self._stop_listening = self.recognizer.listen_in_background(
+                self.microphone, self.on_utterance, phrase_time_limit=PHRASE_TIME_LIMIT)
+            log.info("✓ Background listener started")
+        except Exception as e:
+            log.exception("Microphone setup error: %s", e)
+        finally:
+            self._mic_setup_done = True
 
     def load_config(self):
         """Load or create config file"""
@@ -115,17 +196,57 @@ class GamingAssistant:
         return DEFAULT_CONFIG.copy()
 
     def save_config(self):
-        """Persist config to disk"""
-        # Save current reminders
-        self.config["reminders"] = [r.to_dict() for r in self.reminders]
-        
-        # Write directly to file first
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(self.config, f, indent=2)
-            f.flush()  # Force write to disk
-            os.fsync(f.fileno())  # Force OS to write file to disk
+        """Schedule a config write (no-op unless reminders changed)"""
+        if not self._config_dirty or self._pending_flush is not None:
+            return
+        # Debounce: rapid changes share a single write
+        self._pending_flush = self.root.after(CONFIG_SAVE_DELAY_MS, self._do_flush)
 
-        print(f"Config saved to {CONFIG_FILE}")
+    def _do_flush(self):
+        """Debounced write fired by save_config"""
+        self._pending_flush = None
+        try:
+            self._flush_config()
+        except OSError as e:
+            # Still dirty: the next change or exit retries the write
+            log.error("Config save failed: %s", e)
+
+    def _flush_config(self):
+        """Atomically write the cached config to disk (raises OSError on failure)"""
+        if self._pending_flush is not None:
+            self.root.after_cancel(self._pending_flush)
+            self._pending_flush = None
+
+        # Rebuild serialized reminders only when the list mutated
+        reminders = self.config.get("reminders", [])
+        if self._config_dirty:
+            reminders = [r.to_dict() for r in self.reminders]
+        config = dict(self.config, reminders=reminders)
+
+        if orjson is not None:
+            data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(config, separators=(",", ":")).encode("utf-8")
+
+        # Write a temp file and swap it in, so a crash never leaves a truncated config
+        tmp_file = CONFIG_FILE + ".tmp"
+        try:
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+                f.flush()  # Force write to disk
+                os.fsync(f.fileno())  # Force OS to write file to disk
+            os.replace(tmp_file, CONFIG_FILE)
+        except OSError:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+            raise
+
+        # Only a completed write clears the dirty flag
+        self.config["reminders"] = reminders
+        self._config_dirty = False
+        log.debug("Config saved to %s", CONFIG_FILE)
 
     def load_reminders_from_config(self):
         """Restore reminders from saved config"""
@@ -133,7 +254,12 @@ class GamingAssistant:
             for r_data in self.config["reminders"]:
                 reminder = Reminder.from_dict(r_data)
                 self.reminders.append(reminder)
+                self._index_reminder(reminder)
+                if "created_epoch" not in r_data:
+                    # Legacy ISO timestamps: rewrite the config once in the new format
+                    self._config_dirty = True
             self.update_reminder_list()
+            self.save_config()
 
     def build_gui(self):
         """Create ADHD-friendly interface: large text, minimal clutter, voice-first"""
@@ -243,56 +369,71 @@ class GamingAssistant:
         ).pack(pady=10)
 
     def toggle_listening(self):
-        """Activate voice listener"""
+        """Arm the always-on listener to take the next phrase as a command"""
         if not self.listening:
+            if not self._mic_setup_done:
+                self.speak("Microphone is still starting up. Try again in a moment.")
+                return
+            if self._stop_listening is None:
+                self.speak("Microphone not available. Check your mic and restart.")
+                return
             self.listening = True
             self.mic_button.config(bg="#E67E22", text="🎤 LISTENING...")
-            # Non-blocking: run in thread
-            threading.Thread(target=self.listen_for_command, daemon=True).start()
+            # Brief audio cue (ADHD: attention grabber without overload)
+            self.play_beep()
+            self._armed_at = time.monotonic()
+            self._armed = True
+            # Give up if no phrase arrives (background listener has no overall timeout)
+            self._listen_timeout = self.root.after(
+                (LISTEN_TIMEOUT + PHRASE_TIME_LIMIT) * 1000, self.listen_timed_out)
+
+    def on_utterance(self, recognizer, audio):
+        """Background listener callback: recognize a phrase if the mic button armed us"""
+        # Mic is always hot; speech outside a button press is discarded
+        if not self._armed:
+            return
 
-    def listen_for_command(self):
-        """Capture voice input and process command"""
+        # A phrase that began before the press (game audio, our own TTS) is not
+        # the command; drop it and stay armed for the user's next phrase.
+        # Captured audio also includes up to non_speaking_duration of lead-in silence.
+        duration = len(audio.frame_data) / (audio.sample_rate * audio.sample_width)
+        lead_in = min(recognizer.non_speaking_duration, duration)
+        if time.monotonic() - duration + lead_in < self._armed_at:
+            log.debug("Ignoring phrase that started before the mic button press")
+            return
+        self._armed = False
+        import speech_recognition as sr  # Already loaded by init_voice_input
         try:
-            print("Starting microphone setup...")
-            with sr.Microphone() as source:
-                print("✓ Microphone initialized")
-                # Brief audio cue (ADHD: attention grabber without overload)
-                self.play_beep()
-
-                # Adjust for ambient noise
-                print("Adjusting for ambient noise...")
-                self.recognizer.adjust_for_ambient_noise(source, duration=0.5)
-                print("✓ Ambient noise adjustment complete")
-
-                # Listen
-                print("Listening for command...")
-                audio = self.recognizer.listen(source, timeout=5, phrase_time_limit=10)
-
-                # Convert to text
-                print("Converting speech to text...")
-                command_text = self.recognizer.recognize_google(audio)
-                print(f"Heard: {command_text}")
-
-                # Process command
-                self.root.after(0, self.process_command, command_text)
-
-        except sr.WaitTimeoutError:
-            self.root.after(0, self.speak, "Didn't hear anything. Try again.")
+            # Convert to text
+            log.debug("Converting speech to text...")
+            command_text = recognizer.recognize_google(audio)
+            log.debug("Heard: %s", command_text)
+
+            # Process command
+            self.root.after(0, self.process_command, command_text)
+
         except sr.UnknownValueError:
             self.root.after(0, self.speak, "Sorry, didn't catch that. Try again.")
         except Exception as e:
-            print(f"Microphone error: {str(e)}")
-            import sys
-            print("Python path:", sys.executable)
-            import traceback
-            traceback.print_exc()
-            self.root.after(0, self.speak, f"Microphone error: {str(e)}")
+            log.exception("Speech recognition error: %s", e)
+            self.root.after(0, self.speak, f"Speech recognition error: {str(e)}")
         finally:
             # Reset button
             self.root.after(0, self.reset_mic_button)
 
+    def listen_timed_out(self):
+        """No phrase arrived in time: disarm and tell the user"""
+        self._listen_timeout = None
+        if self._armed:
+            self._armed = False
+            self.speak("Didn't hear anything. Try again.")
+            self.reset_mic_button()
+
     def reset_mic_button(self):
         """Return mic button to ready state"""
+        if self._listen_timeout is not None:
+            self.root.after_cancel(self._listen_timeout)
+            self._listen_timeout = None
         self.listening = False
         self.mic_button.config(bg="#27AE60", text="🎤 HOLD TO SPEAK")
 
@@ -303,19 +444,51 @@ class GamingAssistant:
         pass  # pyttsx3 doesn't do beeps easily; skip for MVP
 
     def speak(self, text):
-        """Text-to-speech feedback (blocking call - use in threads if needed)"""
-        # Update GUI in main thread
-        self.root.after(0, self.status_label.config, {"text": f"🔊 {text}"})
-        self.tts_engine.say(text)
-        self.tts_engine.runAndWait()
-        self.root.after(0, self.status_label.config, {"text": "🎮 Ready to assist"})
+        """Text-to-speech feedback (non-blocking - queued for the TTS worker)"""
+        # Status label is driven by the TTS worker (start and end of speech)
+        self._tts_q.put(text)
+
+    def _tts_worker(self):
+        """Speak queued utterances one at a time (pyttsx3 is not reentrant)"""
+        while True:
+            text = self._tts_q.get()
+            self.post_tts_status(text)
+            try:
+                if self.tts_engine is None:
+                    import pyttsx3
+                    self.tts_engine = pyttsx3.init()
+                    # Adjust TTS speed for clarity (ADHD: slower = easier to process)
+                    self.tts_engine.setProperty('rate', 150)
+                    log.info("✓ Text-to-speech initialized")
+                self.tts_engine.say(text)
+                self.tts_engine.runAndWait()
+            except Exception as e:
+                log.exception("Text-to-speech error: %s", e)
+
+            # Back-to-back utterances share one status transition
+            if self._tts_q.empty():
+                self.post_tts_status(None)
+
+    def post_tts_status(self, text):
+        """Hand the status update (with its text) to the Tk thread"""
+        try:
+            self.root.after(0, self.on_tts_status, text)
+        except (tk.TclError, RuntimeError):
+            pass  # Window already closed
+
+    def on_tts_status(self, text):
+        """Show the utterance being spoken, or the idle status when text is None"""
+        if text:
+            self.status_label.config(text=f"🔊 {text}")
+        else:
+            self.status_label.config(text="🎮 Ready to assist")
 
     def process_command(self, text):
         """Parse spoken command and route to handler"""
         text_lower = text.lower()
 
         # Log what was heard (debugging)
-        print(f"Heard: {text}")
+        log.debug("Heard: %s", text)
 
         # Command: List reminders
         if "list" in text_lower and "reminder" in text_lower:
@@ -339,34 +512,36 @@ class GamingAssistant:
 
     def add_reminder(self, text):
         """Parse and add a reminder"""
-        # Debug: Print received text
-        print(f"Processing reminder text: {text}")
+        # Debug: Log received text
+        log.debug("Processing reminder text: %s", text)
         
         # Check if time-based (e.g., "in 15 minutes" or "in 5 minutes")
-        time_match = re.search(r'(?:in|after) (\d+) minutes?', text, re.IGNORECASE)
+        time_match = _TIME_RE.search(text)
 
         if time_match:
             minutes = int(time_match.group(1))
-            trigger_time = datetime.now() + timedelta(minutes=minutes)
+            trigger_epoch = time.monotonic() + minutes * 60
 
             # Extract reminder text (after "remind me" and before "in X minutes")
-            reminder_text = re.sub(r'.*?(?:remind me|set reminder) (?:to )?', '', text, flags=re.IGNORECASE)
-            reminder_text = re.sub(r'(?:in|after) \d+ minutes?.*', '', reminder_text, flags=re.IGNORECASE).strip()
+            reminder_text = _STRIP_LEAD_RE.sub('', text)
+            reminder_text = _STRIP_TAIL_RE.sub('', reminder_text).strip()
 
-            print(f"Parsed time: {minutes} minutes")
-            print(f"Parsed reminder text: {reminder_text}")
+            log.debug("Parsed time: %d minutes", minutes)
+            log.debug("Parsed reminder text: %s", reminder_text)
 
-            reminder = Reminder(reminder_text, "time", trigger_time)
+            reminder = Reminder(reminder_text, "time", trigger_epoch)
             self.reminders.append(reminder)
+            self._index_reminder(reminder)
 
             self.speak(f"Reminder set for {minutes} minutes: {reminder_text}")
 
         else:
             # Event or resource-based (store as event, manual trigger)
-            reminder_text = re.sub(r'.*remind me (to )?', '', text, flags=re.IGNORECASE).strip()
+            reminder_text = _STRIP_EVENT_RE.sub('', text).strip()
 
             # Detect if resource-based (keywords: gold, wood, food, etc.)
-            if any(word in reminder_text.lower() for word in ["gold", "wood", "food", "iron", "stone", "resource"]):
+            tokens = set(_WORD_RE.findall(reminder_text.lower()))
+            if tokens & _RESOURCE_WORDS:
                 reminder = Reminder(reminder_text, "resource")
                 self.speak(f"Resource reminder set: {reminder_text}. Say 'trigger' to activate.")
             else:
@@ -374,9 +549,12 @@ class GamingAssistant:
                 self.speak(f"Event reminder set: {reminder_text}")
 
             self.reminders.append(reminder)
+            self._index_reminder(reminder)
 
+        self._config_dirty = True
         self.update_reminder_list()
         self.save_config()
+        self._schedule_next()
 
     def list_reminders_voice(self):
         """Read back all reminders via voice"""
@@ -386,77 +564,165 @@ class GamingAssistant:
 
         # Audio cue
         count = len(self.reminders)
-        self.speak(f"You have {count} reminder{'s' if count > 1 else ''}.")
+        lines = [f"You have {count} reminder{'s' if count > 1 else ''}."]
 
+        now = time.monotonic()
         for i, reminder in enumerate(self.reminders, 1):
-            if reminder.reminder_type == "time" and reminder.trigger_time:
-                time_left = reminder.trigger_time - datetime.now()
-                minutes_left = int(time_left.total_seconds() / 60)
-                self.speak(f"{i}. In {minutes_left} minutes: {reminder.text}")
+            if reminder.reminder_type == "time" and reminder.trigger_epoch is not None:
+                time_left = reminder.trigger_epoch - now
+                minutes_left = int(time_left / 60)
+                lines.append(f"{i}. In {minutes_left} minutes: {reminder.text}")
             else:
-                self.speak(f"{i}. {reminder.reminder_type.capitalize()}: {reminder.text}")
+                lines.append(f"{i}. {reminder.reminder_type.capitalize()}: {reminder.text}")
+
+        # One utterance: a single runAndWait instead of one per reminder
+        self.speak(" ".join(lines))
 
     def clear_specific_reminder(self, text):
         """Clear reminder by keyword match"""
         # Extract keywords after "clear reminder"
-        keywords = re.sub(r'.*clear reminder (about )?', '', text, flags=re.IGNORECASE).strip()
+        keywords = _CLEAR_RE.sub('', text).strip()
 
         # Find matching reminder
-        for reminder in self.reminders[:]:
-            if keywords.lower() in reminder.text.lower():
-                self.reminders.remove(reminder)
-                self.speak(f"Cleared reminder: {reminder.text}")
-                self.update_reminder_list()
-                self.save_config()
-                return
+        reminder = self.find_reminder(keywords)
+        if reminder is None:
+            self.speak("No matching reminder found.")
+            return
 
-        self.speak("No matching reminder found.")
+        self.reminders.remove(reminder)
+        self._unindex_reminder(reminder)
+        self._config_dirty = True
+        self.speak(f"Cleared reminder: {reminder.text}")
+        self.update_reminder_list()
+        self.save_config()
+        self._schedule_next()
+
+    def find_reminder(self, keywords):
+        """First reminder (list order) whose text contains the keyword phrase"""
+        keywords = keywords.lower()
+
+        # Index narrows the candidates to reminders containing every query word
+        hits = None
+        for token in set(_WORD_RE.findall(keywords)):
+            ids = self._token_index.get(token, set())
+            hits = ids if hits is None else hits & ids
+            if not hits:
+                break
+
+        if hits:
+            for reminder in self.reminders:
+                if id(reminder) in hits and keywords in reminder.text.lower():
+                    return reminder
+
+        # Partial words ("mine" vs "mines") still match the old way
+        for reminder in self.reminders:
+            if keywords in reminder.text.lower():
+                return reminder
+        return None
+
+    def _index_reminder(self, reminder):
+        """Add a reminder to the keyword index"""
+        self._by_id[id(reminder)] = reminder
+        for token in _WORD_RE.findall(reminder.text.lower()):
+            self._token_index[token].add(id(reminder))
+
+    def _unindex_reminder(self, reminder):
+        """Drop a reminder from the keyword index"""
+        self._by_id.pop(id(reminder), None)
+        for token in set(_WORD_RE.findall(reminder.text.lower())):
+            ids = self._token_index.get(token)
+            if ids is not None:
+                ids.discard(id(reminder))
+                if not ids:
+                    del self._token_index[token]
 
     def clear_all_reminders(self):
         """Remove all reminders"""
         count = len(self.reminders)
         self.reminders.clear()
+        self._token_index.clear()
+        self._by_id.clear()
+        self._config_dirty = True
         self.update_reminder_list()
         self.save_config()
+        self._schedule_next()
         self.speak(f"Cleared {count} reminder{'s' if count != 1 else ''}.")
 
     def update_reminder_list(self):
         """Refresh GUI list display"""
-        self.reminder_text.delete(1.0, tk.END)
-
         if not self.reminders:
-            self.reminder_text.insert(tk.END, "No reminders set.\n")
+            lines = ["No reminders set.\n"]
+        else:
+            lines = []
+            now = time.monotonic()
+            for i, reminder in enumerate(self.reminders, 1):
+                if reminder.reminder_type == "time" and reminder.trigger_epoch is not None:
+                    time_left = reminder.trigger_epoch - now
+                    minutes_left = max(0, int(time_left / 60))
+                    lines.append(f"{i}. [TIME - {minutes_left}m] {reminder.text}\n")
+                else:
+                    lines.append(f"{i}. [{reminder.reminder_type.upper()}] {reminder.text}\n")
+
+        # Skip the redraw entirely when nothing visible changed
+        rendered = "".join(lines)
+        if rendered == self._rendered_reminders:
             return
+        self._rendered_reminders = rendered
 
-        for i, reminder in enumerate(self.reminders, 1):
-            if reminder.reminder_type == "time" and reminder.trigger_time:
-                time_left = reminder.trigger_time - datetime.now()
-                minutes_left = max(0, int(time_left.total_seconds() / 60))
-                self.reminder_text.insert(tk.END, f"{i}. [TIME - {minutes_left}m] {reminder.text}\n")
-            else:
-                self.reminder_text.insert(tk.END, f"{i}. [{reminder.reminder_type.upper()}] {reminder.text}\n")
+        # One insert = one text-widget reflow
+        self.reminder_text.delete(1.0, tk.END)
+        self.reminder_text.insert(tk.END, rendered)
 
     def check_timers(self):
-        """Periodically check for triggered time-based reminders"""
-        now = datetime.now()
+        """Fire due time-based reminders, then schedule the next wake-up"""
+        self._timer_handle = None
+        now = time.monotonic()
+
+        # Single pass: split into due and remaining instead of list.remove() per hit
+        triggered = []
+        remaining = []
+        for r in self.reminders:
+            if r.reminder_type == "time" and r.trigger_epoch is not None and now >= r.trigger_epoch:
+                triggered.append(r)
+            else:
+                remaining.append(r)
 
-        for reminder in self.reminders[:]:
-            if reminder.reminder_type == "time" and reminder.trigger_time:
-                if now >= reminder.trigger_time:
-                    # Trigger alert
-                    self.trigger_reminder_alert(reminder)
-                    self.reminders.remove(reminder)
+        if triggered:
+            self.reminders = remaining
+            for reminder in triggered:
+                self._unindex_reminder(reminder)
+            self._config_dirty = True
+            self.update_reminder_list()
+            self.save_config()
 
-        self.update_reminder_list()
-        self.save_config()
+            # Trigger alerts once the list and disk reflect the removal
+            for reminder in triggered:
+                self.trigger_reminder_alert(reminder)
+        else:
+            # Countdown refresh wake-up; nothing to save
+            self.update_reminder_list()
 
-        # Check again in 5 seconds
-        self.root.after(5000, self.check_timers)
+        self._schedule_next()
+
+    def _schedule_next(self):
+        """Schedule check_timers for the earliest pending time reminder"""
+        if self._timer_handle is not None:
+            self.root.after_cancel(self._timer_handle)
+            self._timer_handle = None
+
+        times = [r.trigger_epoch for r in self.reminders
+                 if r.reminder_type == "time" and r.trigger_epoch is not None]
+        if not times:
+            return  # Nothing pending: no wake-ups at all
+
+        delay = max(0, int((min(times) - time.monotonic()) * 1000))
+        # Also wake periodically so the minutes-left countdown stays current
+        self._timer_handle = self.root.after(min(delay, TIMER_REFRESH_MS), self.check_timers)
 
     def trigger_reminder_alert(self, reminder):
         """Alert user about triggered reminder (voice + popup)"""
         # Voice alert
-        threading.Thread(target=self.speak, args=(f"Reminder: {reminder.text}",), daemon=True).start()
+        self.speak(f"Reminder: {reminder.text}")
 
         # Popup (ADHD: visual + audio redundancy helps)
         messagebox.showinfo("⏰ Reminder", reminder.text)
@@ -473,54 +739,63 @@ class GamingAssistant:
         # Immediately save to disk before starting Steam
         self.config["steam_api_key"] = api_key
         self.config["steam_id"] = steam_id
-        
-        # Write directly to file first
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(self.config, f, indent=2)
-            f.flush()  # Force write to disk
-            os.fsync(f.fileno())  # Force OS to write file to disk
-
-        print(f"Steam credentials saved to {CONFIG_FILE}")
-        print(f"API Key: {api_key[:5]}...")
-        print(f"Steam ID: {steam_id}")
 
-        # Verify the save by reading back
+        # Write directly to file first (atomic temp-file swap, no read-back needed)
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                saved_config = json.load(f)
-                if (saved_config["steam_api_key"] == api_key and 
-                    saved_config["steam_id"] == steam_id):
-                    print("✓ Config file verified")
-                else:
-                    print("✗ Config verification failed")
-                    return
-        except Exception as e:
-            print(f"Config verification error: {str(e)}")
+            self._flush_config()
+        except OSError as e:
+            log.error("Config save failed: %s", e)
+            messagebox.showerror("Save failed", f"Could not save settings to {CONFIG_FILE}:\n{e}")
             return
+        self.update_steam_url()
+
+        log.info("Steam credentials saved to %s", CONFIG_FILE)
+        log.debug("API Key: %s...", api_key[:5])
+        log.debug("Steam ID: %s", steam_id)
 
         self.speak("Steam settings saved. Starting game detection.")
         self.start_steam_polling()
 
+    def update_steam_url(self):
+        """Rebuild the cached Steam API URL from saved credentials"""
+        api_key = self.config.get("steam_api_key")
+        steam_id = self.config.get("steam_id")
+        if api_key and steam_id:
+            self._steam_url = STEAM_API_URL.format(key=api_key, steam_id=steam_id)
+        else:
+            self._steam_url = None
+        # New credentials: forget cached response state
+        self._steam_etag = None
+        self._last_game_status = None
+
     def start_steam_polling(self):
         """Begin polling Steam API for game status"""
         if not self.steam_poll_active:
             self.steam_poll_active = True
+            if self._steam_session is None:
+                import requests  # Only needed once Steam is configured
+                # Reused across polls so the TCP+TLS connection stays alive
+                self._steam_session = requests.Session()
             threading.Thread(target=self.poll_steam_api, daemon=True).start()
 
     def poll_steam_api(self):
         """Check Steam API every 30 seconds for running game"""
+        import requests  # Already loaded by start_steam_polling
         while self.steam_poll_active:
             try:
-                api_key = self.config.get("steam_api_key")
-                steam_id = self.config.get("steam_id")
+                url = self._steam_url
 
-                if not api_key or not steam_id:
+                if not url:
                     time.sleep(30)
                     continue
 
-                # API call
-                url = f"https://api.steampowered.com/ISteamUser/GetPlayerSummaries/v0002/?key={api_key}&steamids={steam_id}"
-                response = requests.get(url, timeout=10)
+                # API call (conditional, so an unchanged response skips parsing)
+                headers = {"If-None-Match": self._steam_etag} if self._steam_etag else {}
+                response = self._steam_session.get(url, headers=headers, timeout=10)
+                if response.status_code == 304:
+                    time.sleep(30)
+                    continue
+                self._steam_etag = response.headers.get("ETag")
                 data = response.json()
 
                 # Parse response
@@ -533,22 +808,30 @@ class GamingAssistant:
 
                         # Check if Civilization VI
                         if "Civilization VI" in game_name or "Civ VI" in game_name:
-                            self.root.after(0, self.update_game_status, game_name, True)
+                            self.post_game_status(game_name, True)
                         else:
-                            self.root.after(0, self.update_game_status, game_name, False)
+                            self.post_game_status(game_name, False)
                     else:
-                        self.root.after(0, self.update_game_status, "No game running", False)
+                        self.post_game_status("No game running", False)
                 else:
-                    self.root.after(0, self.update_game_status, "API error - check credentials", False)
+                    self.post_game_status("API error - check credentials", False)
 
             except requests.exceptions.RequestException:
-                self.root.after(0, self.update_game_status, "Steam API unreachable", False)
+                self.post_game_status("Steam API unreachable", False)
             except Exception as e:
-                self.root.after(0, self.update_game_status, f"Error: {str(e)[:30]}", False)
+                self.post_game_status(f"Error: {str(e)[:30]}", False)
 
             # Wait 30 seconds before next poll
             time.sleep(30)
 
+    def post_game_status(self, game_name, is_civ6):
+        """Forward game status to the GUI thread, skipping unchanged results"""
+        status = (game_name, is_civ6)
+        if status == self._last_game_status:
+            return
+        self._last_game_status = status
+        self.root.after(0, self.update_game_status, game_name, is_civ6)
+
     def update_game_status(self, game_name, is_civ6):
         """Update GUI with detected game"""
         self.current_game = game_name
@@ -562,12 +845,24 @@ class GamingAssistant:
     def on_closing(self):
         """Cleanup on app exit"""
         self.steam_poll_active = False
-        self.save_config()
+        if self._stop_listening is not None:
+            self._stop_listening(wait_for_stop=False)
+        if self._steam_session is not None:
+            self._steam_session.close()
+        # Final synchronous write replaces any pending debounced one
+        if self._config_dirty:
+            try:
+                self._flush_config()
+            except OSError as e:
+                log.error("Config save failed: %s", e)
         self.root.destroy()
 
 
 def main():
     """Entry point"""
+    # Status and errors only; per-command detail is logged at DEBUG
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     print("Gaming Assistant - Voice Command Center")
     print("For veterans with ADHD/PTSD/TBI who play complex strategy games")
     print("=" * 50)
@@ -576,20 +871,16 @@ def main():
     print(f"Python version: {sys.version}")
     print(f"Python executable: {sys.executable}")
 
-    # Check dependencies (basic test)
-    try:
-        import speech_recognition
-        print("✓ Speech Recognition loaded")
-        import pyaudio
-        print(f"✓ PyAudio loaded")
-        import pyttsx3
-        print("✓ pyttsx3 loaded")
-        import requests
-        print("✓ Requests loaded")
-    except ImportError as e:
-        print(f"✗ Missing dependency: {e}")
-        print("Run: pip install SpeechRecognition pyttsx3 pyaudio requests")
-        return
+    # Check dependencies (basic test) without importing them - the app
+    # loads each one lazily when it is first needed
+    from importlib.util import find_spec
+    for module, name in [("speech_recognition", "Speech Recognition"), ("pyaudio", "PyAudio"),
+                         ("pyttsx3", "pyttsx3"), ("requests", "Requests")]:
+        if find_spec(module) is None:
+            print(f"✗ Missing dependency: {module}")
+            print("Run: pip install SpeechRecognition pyttsx3 pyaudio requests")
+            return
+        print(f"✓ {name} found")
 
     # Launch GUI
     root = tk.Tk()